@@ -1,4 +1,4 @@
-from .dataStructure import Structure
+from .dataStructure import Structure, invalidate_dependent_properties
 from .parameter import Bool
 
 
@@ -37,3 +37,87 @@ class CachedPropertiesMixin(Structure):
     def lock(self, lock):
         self._lock = lock
         self.cached_properties = {}
+
+
+class cached_dependent_property(property):
+    """Property which is cached until one of its dependencies is modified.
+
+    Dependencies can be descriptors or other cached dependent properties. When a
+    dependency is set, the cached values of all (transitively) dependent
+    properties are removed.
+
+    Parameters
+    ----------
+    *dependencies : str
+        Names of the attributes the property depends on.
+
+    Examples
+    --------
+    >>> class Tube(Structure):
+    ...     diameter = UnsignedFloat()
+    ...
+    ...     @cached_dependent_property('diameter')
+    ...     def cross_section_area(self):
+    ...         return math.pi/4 * self.diameter**2
+
+    See Also
+    --------
+    CADETProcess.dataStructure.invalidate_dependent_properties
+    """
+
+    def __init__(self, *dependencies):
+        if len(dependencies) > 0 and callable(dependencies[0]):
+            raise TypeError("Dependencies must be specified by name.")
+
+        self.dependencies = dependencies
+        super().__init__()
+
+    def __call__(self, fget):
+        return self.getter(fget)
+
+    def _copy(self, fget, fset, fdel, doc):
+        prop = type(self)(*self.dependencies)
+        property.__init__(prop, fget, fset, fdel, doc)
+        prop.__doc__ = doc
+        return prop
+
+    def getter(self, fget):
+        return self._copy(fget, self.fset, self.fdel, fget.__doc__)
+
+    def setter(self, fset):
+        return self._copy(self.fget, fset, self.fdel, self.__doc__)
+
+    def deleter(self, fdel):
+        return self._copy(self.fget, self.fset, fdel, self.__doc__)
+
+    @property
+    def name(self):
+        return self.fget.__name__
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        cache = instance.__dict__.setdefault('_cached_dependent_properties', {})
+        try:
+            return cache[self.name]
+        except KeyError:
+            pass
+
+        value = super().__get__(instance, cls)
+
+        property_dependents = instance.__dict__.setdefault(
+            '_property_dependents', {}
+        )
+        for dependency in self.dependencies:
+            property_dependents.setdefault(dependency, set()).add(self.name)
+
+        cache[self.name] = value
+
+        return value
+
+    def __set__(self, instance, value):
+        super().__set__(instance, value)
+
+        instance.__dict__.get('_cached_dependent_properties', {}).pop(self.name, None)
+        invalidate_dependent_properties(instance, self.name)
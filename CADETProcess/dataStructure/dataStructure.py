@@ -2,6 +2,7 @@ from abc import ABC
 from collections import OrderedDict
 from inspect import Parameter, Signature
 from functools import wraps
+import operator
 from warnings import warn
 
 from addict import Dict
@@ -9,6 +10,31 @@ import numpy as np
 
 
 # %% Descriptors
+def invalidate_dependent_properties(instance, name):
+    """Remove cached values of properties that depend on an attribute.
+
+    Parameters
+    ----------
+    instance : Any
+        Instance which holds the cached values.
+    name : str
+        Name of the attribute that was modified.
+
+    See Also
+    --------
+    CADETProcess.dataStructure.cached_dependent_property
+    """
+    try:
+        dependents = instance.__dict__['_property_dependents'].pop(name)
+    except KeyError:
+        return
+
+    cache = instance.__dict__['_cached_dependent_properties']
+    for dependent in dependents:
+        cache.pop(dependent, None)
+        invalidate_dependent_properties(instance, dependent)
+
+
 class Descriptor(ABC):
     """Base class for descriptors.
 
@@ -34,6 +60,8 @@ class Descriptor(ABC):
         return instance.__dict__[self.name]
 
     def __set__(self, instance, value):
+        invalidate_dependent_properties(instance, self.name)
+
         if value is None:
             try:
                 del instance.__dict__[self.name]
@@ -45,6 +73,7 @@ class Descriptor(ABC):
         instance.__dict__[self.name] = value
 
     def __delete__(self, instance):
+        invalidate_dependent_properties(instance, self.name)
         del instance.__dict__[self.name]
 
 
@@ -217,6 +246,12 @@ class StructMeta(type):
         List of descriptors associated with a class.
     _parameters : list
         List of parameters aggregated from the class and its bases.
+    _parameters_set : frozenset
+        Set of parameters for fast membership tests.
+    _parameter_getters : tuple
+        Attribute getters for each parameter, in the same order as `_parameters`.
+    _descriptor_parameters : dict
+        Mapping of parameters which are managed by descriptors to the descriptor.
     _sized_parameters : list
         List of parameters that have a `size` attribute.
     _polynomial_parameters : list
@@ -283,8 +318,14 @@ class StructMeta(type):
             parameters += base_parameters
 
         setattr(clsobj, '_parameters', parameters)
+        setattr(clsobj, '_parameters_set', frozenset(parameters))
+        setattr(
+            clsobj, '_parameter_getters',
+            tuple(operator.attrgetter(param) for param in parameters)
+        )
 
         # Categorize parameters based on their attributes
+        descriptor_parameters = {}
         sized_parameters = []
         polynomial_parameters = []
         required_parameters = []
@@ -297,6 +338,8 @@ class StructMeta(type):
             if not isinstance(descriptor, Descriptor):
                 continue
 
+            descriptor_parameters[param] = descriptor
+
             if hasattr(descriptor, 'size'):
                 sized_parameters.append(param)
             if hasattr(descriptor, 'fill_values'):
@@ -306,6 +349,7 @@ class StructMeta(type):
             if descriptor.is_optional:
                 optional_parameters.append(param)
 
+        setattr(clsobj, '_descriptor_parameters', descriptor_parameters)
         setattr(clsobj, '_sized_parameters', sized_parameters)
         setattr(clsobj, '_polynomial_parameters', polynomial_parameters)
         setattr(clsobj, '_required_parameters', required_parameters)
@@ -360,9 +404,9 @@ class Structure(metaclass=StructMeta):
             Keyword arguments representing parameters.
         """
         self._parameters_dict = Dict()
-        for param in self._parameters:
-            value = getattr(self, param)
-            if param in self._optional_parameters and value is None:
+        for param, getter in zip(self._parameters, self._parameter_getters):
+            value = getter(self)
+            if value is None and param in self._optional_parameters:
                 continue
 
             self._parameters_dict[param] = value
@@ -373,10 +417,18 @@ class Structure(metaclass=StructMeta):
 
     @property
     def parameters(self):
-        """dict: Parameters of the instance."""
+        """dict: Parameters of the instance.
+
+        Notes
+        -----
+        The dictionary is kept up to date by the descriptors whenever a parameter is
+        set. Only aggregated parameters need to be collected on access since they
+        depend on the state of other instances.
+        """
         parameters = self._parameters_dict
 
-        parameters.update(self.aggregated_parameters)
+        if self._aggregators:
+            parameters.update(self.aggregated_parameters)
 
         return parameters
 
@@ -394,12 +446,21 @@ class Structure(metaclass=StructMeta):
         ValueError
             If any of the provided parameters is not valid.
         """
+        descriptor_parameters = self._descriptor_parameters
         for param, value in parameters.items():
-            if param not in self._parameters:
+            if param not in self._parameters_set:
                 raise ValueError('Not a valid parameter.')
-            if value is not None:
+            if value is None:
+                continue
+
+            # Descriptors update the parameters dict themselves.
+            try:
+                descriptor = descriptor_parameters[param]
+            except KeyError:
                 setattr(self, param, value)
-                self._parameters_dict[param] = value
+                self._parameters_dict[param] = getattr(self, param)
+            else:
+                descriptor.__set__(self, value)
 
     @property
     def sized_parameters(self):
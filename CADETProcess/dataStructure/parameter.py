@@ -8,6 +8,9 @@ import numpy as np
 from .dataStructure import Descriptor
 
 
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, np.number)
+
+
 class ParameterBase(Descriptor):
     """
     Base class for model parameters with potential constraints or type-casting.
@@ -80,7 +83,13 @@ class ParameterBase(Descriptor):
 
     @property
     def default(self):
-        """Any: Get or set the default value of the parameter."""
+        """Any: Get or set the default value of the parameter.
+
+        Mutable default values are deep-copied s.t. instances do not share them.
+        """
+        if isinstance(self._default, _IMMUTABLE_TYPES):
+            return self._default
+
         return copy.deepcopy(self._default)
 
     @default.setter
@@ -164,14 +173,14 @@ class ParameterBase(Descriptor):
             Value to set.
         """
         if value is None:
+            # Default values are already prepared and checked.
             value = self.get_default_value(instance)
-
-        if value is not None:
+        else:
             value = self._prepare(instance, value, recursive=True)
             self._check(instance, value, recursive=True)
 
         try:
-            if self.name in instance._parameters:
+            if self.name in instance._parameters_set:
                 instance._parameters_dict[self.name] = value
         except AttributeError:
             pass
@@ -578,6 +587,11 @@ class NdArray(Typed):
     """
     Parameter descriptor constrained to np.ndarray values.
 
+    Attributes
+    ----------
+    dtype : data-type, optional
+        If not None, values are converted to this data-type when set.
+
     Notes
     -----
     The `cast_value` method automatically converts lists to numpy arrays and
@@ -586,6 +600,24 @@ class NdArray(Typed):
 
     ty = np.ndarray
 
+    def __init__(self, *args, dtype=None, **kwargs):
+        """
+        Initialize a NdArray instance.
+
+        Parameters
+        ----------
+        *args : Any
+            Variable length argument list.
+        dtype : data-type, optional
+            If not None, values are converted to this data-type when set.
+            Defaults to None.
+        **kwargs : Any
+            Arbitrary keyword arguments.
+        """
+        self.dtype = dtype
+
+        super().__init__(*args, **kwargs)
+
     def cast_value(self, value):
         """
         Cast lists or scalars (int or float) to numpy arrays.
@@ -603,9 +635,11 @@ class NdArray(Typed):
             Otherwise, it returns the value unchanged.
         """
         if isinstance(value, list):
-            value = np.array(value)
+            value = np.array(value, dtype=self.dtype)
         elif isinstance(value, (int, float)):
-            value = np.array((value,))
+            value = np.array((value,), dtype=self.dtype)
+        elif isinstance(value, np.ndarray) and self.dtype is not None:
+            value = value.astype(self.dtype, copy=False)
 
         return value
 
@@ -831,16 +865,18 @@ class RangedArray(Ranged):
             If any element(s) of the array are outside the specified bounds. The raised exception
             indicates the index/indices of out-of-bound values.
         """
-        value_array = np.array(value)
+        value_array = np.asarray(value)
 
-        if np.any(self.lb_op(value_array, self.lb)):
-            idx = np.where(self.lb_op(value_array, self.lb))[0]
+        below_lb = self.lb_op(value_array, self.lb)
+        if np.any(below_lb):
+            idx = np.where(below_lb)[0]
             raise ValueError(
                 f"Element(s) at index/indices {idx} below the lower bound of {self.lb}"
             )
 
-        elif np.any(self.ub_op(value_array, self.ub)):
-            idx = np.where(self.ub_op(value_array, self.ub))[0]
+        above_ub = self.ub_op(value_array, self.ub)
+        if np.any(above_ub):
+            idx = np.where(above_ub)[0]
             raise ValueError(
                 f"Element(s) at index/indices {idx} above the upper bound of {self.ub}"
             )
@@ -105,6 +105,11 @@ class SequentialBackend(ParallelizationBackendBase):
         return results
 
 
+def _evaluate_chunk(function, chunk):
+    """Evaluate the function sequentially at all individuals of a chunk."""
+    return [function(ind) for ind in chunk]
+
+
 try:
     from joblib import Parallel, delayed
     __all__.append("Joblib")
@@ -144,10 +149,27 @@ class Joblib(ParallelizationBackendBase):
             List of results of function evaluations.
 
         """
-        backend = Parallel(n_jobs=self.n_cores, verbose=self.verbose)
-        results = backend(delayed(function)(x) for x in population)
-
-        return results
+        population = list(population)
+        n_jobs = min(self._n_cores, len(population))
+        if n_jobs == 0:
+            return []
+
+        # Dispatch chunks s.t. function is only serialized once per chunk instead of
+        # once per individual. Several chunks per worker keep the load balanced if
+        # evaluation times differ between individuals.
+        n_chunks = min(len(population), 4 * n_jobs)
+        chunk_size = -(-len(population) // n_chunks)
+        chunks = [
+            population[i:i + chunk_size]
+            for i in range(0, len(population), chunk_size)
+        ]
+
+        backend = Parallel(n_jobs=n_jobs, verbose=self.verbose)
+        chunk_results = backend(
+            delayed(_evaluate_chunk)(function, chunk) for chunk in chunks
+        )
+
+        return [result for results in chunk_results for result in results]
 
 
 try:
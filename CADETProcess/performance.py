@@ -43,6 +43,7 @@ it's no longer required for setting up as optimization problem.
 
 """
 
+import numba
 import numpy as np
 
 from CADETProcess import CADETProcessError
@@ -167,6 +168,18 @@ class Performance(Structure):
             f'mass_balance_difference={np.array_repr(self.mass_balance_difference)})'
 
 
+@numba.njit(cache=True, error_model='numpy')
+def _weighted_average(values, ranking):
+    """Compute the ranking-weighted average of component values."""
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(values.shape[0]):
+        numerator += values[i] * ranking[i]
+        denominator += ranking[i]
+
+    return numerator / denominator
+
+
 class RankedPerformance():
     """Class for calculating a weighted average of the Performance
 
@@ -202,7 +215,7 @@ class RankedPerformance():
         elif len(ranking) != self.performance.n_comp:
             raise CADETProcessError('Number of components does not match.')
 
-        self._ranking = ranking
+        self._ranking = np.asarray(ranking, dtype=np.float64)
 
     def to_dict(self):
         return {
@@ -212,7 +225,8 @@ class RankedPerformance():
     def __getattr__(self, item):
         if item not in self._performance_keys:
             raise AttributeError
-        return sum(self._performance[item]*self.ranking)/sum(self.ranking)
+        values = np.asarray(self._performance[item], dtype=np.float64)
+        return np.float64(_weighted_average(values, self.ranking))
 
     def __getitem__(self, item):
         if item not in self._performance_keys:
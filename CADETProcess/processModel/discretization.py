@@ -76,15 +76,13 @@ class DiscretizationParametersBase(Structure):
 
     @parameters.setter
     def parameters(self, parameters):
-        try:
-            self.weno_parameters.parameters = parameters.pop('weno')
-        except KeyError:
-            pass
-        try:
-            self.consistency_solver.parameters \
-                = parameters.pop('consistency_solver')
-        except KeyError:
-            pass
+        weno_parameters = parameters.pop('weno', None)
+        if weno_parameters is not None:
+            self.weno_parameters.parameters = weno_parameters
+
+        consistency_solver_parameters = parameters.pop('consistency_solver', None)
+        if consistency_solver_parameters is not None:
+            self.consistency_solver.parameters = consistency_solver_parameters
 
         super(DiscretizationParametersBase, self.__class__).parameters.fset(
             self, parameters
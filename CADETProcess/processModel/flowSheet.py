@@ -1,4 +1,5 @@
 from functools import wraps
+import math
 from warnings import warn
 
 import numpy as np
@@ -41,6 +42,7 @@ class FlowSheet(Structure):
         self.component_system = component_system
         self.name = name
         self._units = []
+        self._unit_indices = {}
         self._feed_inlets = []
         self._eluent_inlets = []
         self._product_outlets = []
@@ -139,12 +141,20 @@ class FlowSheet(Structure):
     @property
     def units_dict(self):
         """dict: Unit operation names and objects."""
-        return {unit.name: unit for unit in self.units}
+        return {unit.name: unit for unit in self._units}
 
     @property
     def unit_names(self):
         """list: Names of unit operations."""
-        return [unit.name for unit in self.units]
+        return [unit.name for unit in self._units]
+
+    def _update_unit_lookup(self):
+        """Update lookup table for unit indices.
+
+        Only needs to be called when units are added or removed. The table is keyed
+        by the unit objects s.t. it remains valid if units are renamed.
+        """
+        self._unit_indices = {unit: index for index, unit in enumerate(self._units)}
 
     @property
     def number_of_units(self):
@@ -171,11 +181,11 @@ class FlowSheet(Structure):
             Returns the unit index of the unit_operation.
 
         """
-        if unit not in self.units:
+        try:
+            return self._unit_indices[unit]
+        except KeyError:
             raise CADETProcessError('Unit not in flow sheet')
 
-        return self.units.index(unit)
-
     @property
     def inlets(self):
         """list: All Inlets in the system."""
@@ -237,6 +247,7 @@ class FlowSheet(Structure):
             raise CADETProcessError('Component systems do not match.')
 
         self._units.append(unit)
+        self._update_unit_lookup()
         self._connections[unit] = Dict({
             'origins': [],
             'destinations': [],
@@ -301,6 +312,7 @@ class FlowSheet(Structure):
             self.remove_connection(unit, destination)
 
         self._units.remove(unit)
+        self._update_unit_lookup()
         self._connections.pop(unit)
         self._output_states.pop(unit)
         self.__dict__.pop(unit.name)
@@ -493,7 +505,7 @@ class FlowSheet(Structure):
         ----------
         unit : UnitBaseClass
             UnitOperation of flowsheet.
-        state : int or list of floats or dict
+        state : int or list of floats or np.ndarray or dict
             new output state of the unit.
 
         Raises
@@ -520,6 +532,10 @@ class FlowSheet(Structure):
             output_state = [0.0] * state_length
             output_state[state] = 1.0
 
+            # One-hot states sum up to 1 by construction.
+            self._output_states[unit] = output_state
+            return
+
         elif isinstance(state, dict):
             output_state = [0.0] * state_length
             for dest, value in state.items():
@@ -531,16 +547,16 @@ class FlowSheet(Structure):
                 index = self.connections[unit].destinations.index(dest)
                 output_state[index] = value
 
-        elif isinstance(state, list):
+        elif isinstance(state, (list, np.ndarray)):
             if len(state) != state_length:
                 raise CADETProcessError(f'Expected length {state_length}.')
 
-            output_state = state
+            output_state = np.asarray(state, dtype=float).tolist()
 
         else:
-            raise TypeError("Output state must be integer, list or dict.")
+            raise TypeError("Output state must be integer, list, array or dict.")
 
-        if state_length != 0 and not np.isclose(sum(output_state), 1):
+        if state_length != 0 and not np.isclose(math.fsum(output_state), 1):
             raise CADETProcessError('Sum of fractions must be 1')
 
         self._output_states[unit] = output_state
@@ -585,11 +601,12 @@ class FlowSheet(Structure):
         Forum discussion on flow rate calculation:
         https://forum.cadet-web.de/t/improving-the-flowrate-calculation/795
         """
-        flow_rates = {
-            unit.name: unit.flow_rate
-            for unit in (self.inlets + self.cstrs)
-            if unit.flow_rate is not None
-        }
+        # Every read of flow_rate validates the stored value, so only read it once.
+        flow_rates = {}
+        for unit in self.inlets + self.cstrs:
+            flow_rate = unit.flow_rate
+            if flow_rate is not None:
+                flow_rates[unit.name] = flow_rate
 
         output_states = self.output_states
 
@@ -605,20 +622,26 @@ class FlowSheet(Structure):
                     output_states[unit] = list(value.ravel())
 
         n_units = self.number_of_units
+        unit_indices = {unit.name: index for unit, index in self._unit_indices.items()}
+
+        # w_out_help contains the fraction of the outgoing flow of every origin
+        # (columns) which is directed to the respective destination (rows).
+        w_out_help = np.zeros((n_units, n_units))
+
+        for origin, connections in self.connections.items():
+            if len(connections.destinations) == 0:
+                continue
+            o_index = unit_indices[origin.name]
+            d_indices = [unit_indices[dest.name] for dest in connections.destinations]
+            w_out_help[d_indices, o_index] = output_states[origin]
 
         # Setup matrix with output states.
-        w_out = np.zeros((n_units, n_units))
+        fixed_indices = [unit_indices[unit_name] for unit_name in flow_rates]
 
-        for unit in self.units:
-            unit_index = self.get_unit_index(unit)
-            if unit.name in flow_rates:
-                w_out[unit_index, unit_index] = 1
-            else:
-                for origin in self.connections[unit]['origins']:
-                    o_index = self.get_unit_index(origin)
-                    local_d_index = self.connections[origin].destinations.index(unit)
-                    w_out[unit_index, o_index] = output_states[origin][local_d_index]
-                w_out[unit_index, unit_index] += -1
+        w_out = w_out_help.copy()
+        w_out[np.diag_indices(n_units)] -= 1
+        w_out[fixed_indices, :] = 0
+        w_out[fixed_indices, fixed_indices] = 1
 
         # Check for a singular matrix before the loop
         if np.linalg.cond(w_out) == np.inf:
@@ -630,18 +653,14 @@ class FlowSheet(Structure):
 
         # Solve system of equations for each polynomial coefficient
         total_flow_rate_coefficents = np.zeros((4, n_units))
+        fixed_coeffs = np.array(list(flow_rates.values())).reshape(len(flow_rates), 4)
         for i in range(4):
-            if len(flow_rates) == 0:
-                continue
-
-            coeffs = np.array(list(flow_rates.values()), ndmin=2)[:, i]
+            coeffs = fixed_coeffs[:, i]
             if not np.any(coeffs):
                 continue
 
             Q_vec = np.zeros(n_units)
-            for unit_name in flow_rates:
-                unit_index = self.get_unit_index(self.units_dict[unit_name])
-                Q_vec[unit_index] = flow_rates[unit_name][i]
+            Q_vec[fixed_indices] = coeffs
             try:
                 total_flow_rate_coefficents[i, :] = np.linalg.solve(w_out, Q_vec)
             except np.linalg.LinAlgError:
@@ -650,16 +669,6 @@ class FlowSheet(Structure):
                     "Please check the flow sheet setup."
                 )
 
-        # w_out_help is the same as w_out but it contains the origin flow for every unit
-        w_out_help = np.zeros((n_units, n_units))
-
-        for unit in self.connections:
-            unit_index = self.get_unit_index(unit)
-            for origin in self.connections[unit]['origins']:
-                o_index = self.get_unit_index(origin)
-                local_d_index = self.connections[origin].destinations.index(unit)
-                w_out_help[unit_index, o_index] = output_states[origin][local_d_index]
-
         # Calculate total_in as a matrix in "one" step rather than iterating manually.
         total_in_matrix = w_out_help @ total_flow_rate_coefficents.T
 
@@ -667,34 +676,32 @@ class FlowSheet(Structure):
         return_flow_rates = Dict()
         for index, unit in enumerate(self.units):
             unit_solution_dict = Dict()
+            connections = self.connections[unit]
+            total_out = total_flow_rate_coefficents[:, index]
 
             if not isinstance(unit, Inlet):
-                unit_solution_dict['total_in'] = list(total_in_matrix[index])
+                unit_solution_dict['total_in'] = total_in_matrix[index].tolist()
 
             if not isinstance(unit, Outlet):
-                unit_solution_dict['total_out'] = list(total_flow_rate_coefficents[:, index])
+                unit_solution_dict['total_out'] = total_out.tolist()
 
             if not isinstance(unit, Inlet):
-                unit_solution_dict['origins'] = Dict(
-                    {
-                        origin.name: list(
-                            total_flow_rate_coefficents[:, self.get_unit_index(origin)]
-                            * w_out_help[index, self.get_unit_index(origin)]
-                        )
-                        for origin in self.connections[unit].origins
-                    }
-                )
+                origins = Dict()
+                for origin in connections.origins:
+                    o_index = unit_indices[origin.name]
+                    origins[origin.name] = (
+                        w_out_help[index, o_index]
+                        * total_flow_rate_coefficents[:, o_index]
+                    ).tolist()
+                unit_solution_dict['origins'] = origins
 
             if not isinstance(unit, Outlet):
-                unit_solution_dict['destinations'] = Dict(
-                    {
-                        destination.name: list(
-                            total_flow_rate_coefficents[:, index]
-                            * w_out_help[self.get_unit_index(destination), index]
-                        )
-                        for destination in self.connections[unit].destinations
-                    }
-                )
+                destinations = Dict()
+                for destination in connections.destinations:
+                    d_index = unit_indices[destination.name]
+                    destinations[destination.name] = \
+                        (w_out_help[d_index, index] * total_out).tolist()
+                unit_solution_dict['destinations'] = destinations
 
             return_flow_rates[unit.name] = unit_solution_dict
 
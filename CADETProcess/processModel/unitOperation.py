@@ -5,12 +5,12 @@ import warnings
 from CADETProcess import CADETProcessError
 
 from CADETProcess.dataStructure import frozen_attributes
-from CADETProcess.dataStructure import Structure
+from CADETProcess.dataStructure import Structure, cached_dependent_property
 from CADETProcess.dataStructure import (
     Constant, UnsignedFloat,
     String, Switch,
-    SizedUnsignedList,
-    Polynomial, NdPolynomial, SizedList
+    SizedNdArray, SizedUnsignedNdArray,
+    Polynomial, NdPolynomial
 )
 
 from .componentSystem import ComponentSystem
@@ -44,6 +44,9 @@ __all__ = [
 ]
 
 
+_QUARTER_PI = math.pi / 4.0
+
+
 @frozen_attributes
 class UnitBaseClass(Structure):
     """Base class for all UnitOperation classes.
@@ -88,6 +91,8 @@ class UnitBaseClass(Structure):
         self.name = name
         self.component_system = component_system
 
+        self._sub_models = {}
+
         self.binding_model = NoBinding()
 
         self.bulk_reaction_model = NoReaction()
@@ -129,6 +134,10 @@ class UnitBaseClass(Structure):
                 )
 
         self._discretization = discretization
+        self._update_sub_model(
+            'discretization', discretization,
+            isinstance(discretization, NoDiscretization)
+        )
 
     @property
     def n_comp(self):
@@ -139,44 +148,54 @@ class UnitBaseClass(Structure):
         """dict: Dictionary with parameter values."""
         parameters = super().parameters
 
-        if not isinstance(self.binding_model, NoBinding):
-            parameters['binding_model'] = self.binding_model.parameters
-        if not isinstance(self.bulk_reaction_model, NoReaction):
-            parameters['bulk_reaction_model'] = self.bulk_reaction_model.parameters
-        if not isinstance(self.particle_reaction_model, NoReaction):
-            parameters['particle_reaction_model'] = \
-                self.particle_reaction_model.parameters
-        if not isinstance(self.discretization, NoDiscretization):
-            parameters['discretization'] = \
-                self.discretization.parameters
+        for name, sub_model in self._sub_models.items():
+            parameters[name] = sub_model.parameters
 
         return parameters
 
     @parameters.setter
     def parameters(self, parameters):
-        try:
-            self.binding_model.parameters = parameters.pop('binding_model')
-        except KeyError:
-            pass
-        try:
-            self.bulk_reaction_model.parameters = parameters.pop(
-                'bulk_reaction_model'
-            )
-        except KeyError:
-            pass
-        try:
-            self.particle_reaction_model.parameters = parameters.pop(
-                'particle_reaction_model'
-            )
-        except KeyError:
-            pass
-        try:
-            self.discretization.parameters = parameters.pop('discretization')
-        except KeyError:
-            pass
+        binding_parameters = parameters.pop('binding_model', None)
+        if binding_parameters is not None:
+            self.binding_model.parameters = binding_parameters
+
+        bulk_reaction_parameters = parameters.pop('bulk_reaction_model', None)
+        if bulk_reaction_parameters is not None:
+            self.bulk_reaction_model.parameters = bulk_reaction_parameters
+
+        particle_reaction_parameters = parameters.pop('particle_reaction_model', None)
+        if particle_reaction_parameters is not None:
+            self.particle_reaction_model.parameters = particle_reaction_parameters
+
+        discretization_parameters = parameters.pop('discretization', None)
+        if discretization_parameters is not None:
+            self.discretization.parameters = discretization_parameters
 
         super(UnitBaseClass, self.__class__).parameters.fset(self, parameters)
 
+    def _update_sub_model(self, name, sub_model, is_empty):
+        """Register sub model s.t. its parameters are included in `parameters`.
+
+        Parameters
+        ----------
+        name : str
+            Name of the sub model parameter.
+        sub_model : Structure
+            Sub model (e.g. binding model) of the unit operation.
+        is_empty : bool
+            If True, the sub model is a placeholder without parameters (e.g.
+            NoBinding) and any previously registered sub model is removed.
+
+        """
+        if is_empty:
+            self._sub_models.pop(name, None)
+            try:
+                self._parameters_dict.pop(name, None)
+            except AttributeError:
+                pass
+        else:
+            self._sub_models[name] = sub_model
+
     @property
     def section_dependent_parameters(self):
         parameters = {
@@ -238,15 +257,16 @@ class UnitBaseClass(Structure):
         if not isinstance(binding_model, BindingBaseClass):
             raise TypeError('Expected BindingBaseClass')
 
-        if not isinstance(binding_model, NoBinding):
+        is_no_binding = isinstance(binding_model, NoBinding)
+        if not is_no_binding:
             if not self.supports_binding:
                 raise CADETProcessError('Unit does not support binding models.')
 
-            if binding_model.component_system is not self.component_system \
-                    and not isinstance(binding_model, NoBinding):
+            if binding_model.component_system is not self.component_system:
                 raise CADETProcessError('Component systems do not match.')
 
         self._binding_model = binding_model
+        self._update_sub_model('binding_model', binding_model, is_no_binding)
 
     @property
     def n_bound_states(self):
@@ -269,7 +289,8 @@ class UnitBaseClass(Structure):
 
     @bulk_reaction_model.setter
     def bulk_reaction_model(self, bulk_reaction_model):
-        if not isinstance(bulk_reaction_model, NoReaction):
+        is_no_reaction = isinstance(bulk_reaction_model, NoReaction)
+        if not is_no_reaction:
             if not isinstance(bulk_reaction_model, BulkReactionBase):
                 raise TypeError('Expected BulkReactionBase')
 
@@ -282,6 +303,9 @@ class UnitBaseClass(Structure):
                 raise CADETProcessError('Component systems do not match.')
 
         self._bulk_reaction_model = bulk_reaction_model
+        self._update_sub_model(
+            'bulk_reaction_model', bulk_reaction_model, is_no_reaction
+        )
 
     @property
     def particle_reaction_model(self):
@@ -310,7 +334,8 @@ class UnitBaseClass(Structure):
             except NotImplementedError:
                 pass
 
-        if not isinstance(particle_reaction_model, NoReaction):
+        is_no_reaction = isinstance(particle_reaction_model, NoReaction)
+        if not is_no_reaction:
             if not isinstance(particle_reaction_model, ParticleReactionBase):
                 raise TypeError('Expected ReactionBaseClass')
 
@@ -323,6 +348,9 @@ class UnitBaseClass(Structure):
                 raise CADETProcessError('Component systems do not match.')
 
         self._particle_reaction_model = particle_reaction_model
+        self._update_sub_model(
+            'particle_reaction_model', particle_reaction_model, is_no_reaction
+        )
 
     def __repr__(self):
         """str: String-representation of the object."""
@@ -447,7 +475,7 @@ class TubularReactorBase(UnitBaseClass):
     def total_porosity(self):
         pass
 
-    @property
+    @cached_dependent_property('diameter')
     def cross_section_area(self):
         """float: Cross section area of a Column.
 
@@ -460,11 +488,11 @@ class TubularReactorBase(UnitBaseClass):
 
         """
         if self.diameter is not None:
-            return math.pi/4 * self.diameter**2
+            return _QUARTER_PI * self.diameter * self.diameter
 
     @cross_section_area.setter
     def cross_section_area(self, cross_section_area):
-        self.diameter = (4*cross_section_area/math.pi)**0.5
+        self.diameter = math.sqrt(cross_section_area / _QUARTER_PI)
 
     def set_diameter_from_interstitial_velicity(self, Q, u0):
         """Set diamter from flow rate and interstitial velocity.
@@ -488,7 +516,7 @@ class TubularReactorBase(UnitBaseClass):
         """
         self.cross_section_area = Q/(u0*self.total_porosity)
 
-    @property
+    @cached_dependent_property('total_porosity', 'cross_section_area')
     def cross_section_area_interstitial(self):
         """float: Interstitial area between particles.
 
@@ -505,7 +533,7 @@ class TubularReactorBase(UnitBaseClass):
         """
         return self.total_porosity * self.cross_section_area
 
-    @property
+    @cached_dependent_property('total_porosity', 'cross_section_area')
     def cross_section_area_liquid(self):
         """float: Liquid fraction of column cross section area.
 
@@ -519,7 +547,7 @@ class TubularReactorBase(UnitBaseClass):
         """
         return self.total_porosity * self.cross_section_area
 
-    @property
+    @cached_dependent_property('total_porosity', 'cross_section_area')
     def cross_section_area_solid(self):
         """float: Liquid fraction of column cross section area.
 
@@ -532,7 +560,7 @@ class TubularReactorBase(UnitBaseClass):
         """
         return (1 - self.total_porosity) * self.cross_section_area
 
-    @property
+    @cached_dependent_property('cross_section_area', 'length')
     def volume(self):
         """float: Volume of the TubularReactor.
 
@@ -543,7 +571,7 @@ class TubularReactorBase(UnitBaseClass):
         """
         return self.cross_section_area * self.length
 
-    @property
+    @cached_dependent_property('cross_section_area_interstitial', 'length')
     def volume_interstitial(self):
         """float: Interstitial volume between particles.
 
@@ -554,12 +582,12 @@ class TubularReactorBase(UnitBaseClass):
         """
         return self.cross_section_area_interstitial * self.length
 
-    @property
+    @cached_dependent_property('cross_section_area_liquid', 'length')
     def volume_liquid(self):
         """float: Volume of the liquid phase."""
         return self.cross_section_area_liquid * self.length
 
-    @property
+    @cached_dependent_property('cross_section_area_solid', 'length')
     def volume_solid(self):
         """float: Volume of the solid phase."""
         return self.cross_section_area_solid * self.length
@@ -603,7 +631,7 @@ class TubularReactorBase(UnitBaseClass):
         NTP
 
         """
-        return self.length/self.t0(flow_rate)
+        return flow_rate / self.cross_section_area_interstitial
 
     def NTP(self, flow_rate):
         r"""Number of theoretical plates.
@@ -662,7 +690,7 @@ class TubularReactor(TubularReactorBase):
 
     Attributes
     ----------
-    c : List of unsigned floats. Length depends on n_comp
+    c : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the reactor.
     solution_recorder : TubularReactorRecorder
         Solution recorder for the unit operation.
@@ -673,7 +701,7 @@ class TubularReactor(TubularReactorBase):
 
     total_porosity = Constant(1)
 
-    c = SizedList(size='n_comp', default=0)
+    c = SizedNdArray(size='n_comp', default=0, dtype=float)
     _initial_state = ['c']
     _parameters = ['c']
 
@@ -695,9 +723,9 @@ class LumpedRateModelWithoutPores(TubularReactorBase):
     ----------
     total_porosity : UnsignedFloat between 0 and 1.
         Total porosity of the column.
-    c : List of unsigned floats. Length depends on n_comp
+    c : Array of unsigned floats. Length depends on n_comp
             Initial concentration of the reactor.
-    q : List of unsigned floats. Length depends on n_comp
+    q : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the bound phase.
     solution_recorder : LRMRecorder
         Solution recorder for the unit operation.
@@ -717,8 +745,8 @@ class LumpedRateModelWithoutPores(TubularReactorBase):
     total_porosity = UnsignedFloat(ub=1)
     _parameters = ['total_porosity']
 
-    c = SizedList(size='n_comp', default=0)
-    _q = SizedUnsignedList(size='n_bound_states', default=0)
+    c = SizedNdArray(size='n_comp', default=0, dtype=float)
+    _q = SizedUnsignedNdArray(size='n_bound_states', default=0, dtype=float)
     _initial_state = TubularReactorBase._initial_state + ['q']
 
     _parameters = _parameters + _initial_state
@@ -743,7 +771,7 @@ class LumpedRateModelWithoutPores(TubularReactorBase):
             raise CADETProcessError("Cannot set q without binding model.")
         self._q = q
 
-        self.parameters['q'] = q
+        self.parameters['q'] = self._q
 
 
 class LumpedRateModelWithPores(TubularReactorBase):
@@ -757,15 +785,15 @@ class LumpedRateModelWithPores(TubularReactorBase):
         Porosity of particles.
     particle_radius : UnsignedFloat
         Radius of the particles.
-    film_diffusion : List of unsigned floats. Length depends on n_comp.
+    film_diffusion : Array of unsigned floats. Length depends on n_comp.
         Diffusion rate for components in pore volume.
-    pore_accessibility : List of unsigned floats. Length depends on n_comp.
+    pore_accessibility : Array of unsigned floats. Length depends on n_comp.
         Accessibility of pores for components.
-    c : List of unsigned floats. Length depends on n_comp
+    c : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the reactor.
-    cp : List of unsigned floats. Length depends on n_comp
+    cp : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the pores
-    q : List of unsigned floats. Length depends on n_comp
+    q : Array of unsigned floats. Length depends on n_comp
         Initial concntration of the bound phase.
     solution_recorder : LRMPRecorder
         Solution recorder for the unit operation.
@@ -779,8 +807,10 @@ class LumpedRateModelWithPores(TubularReactorBase):
     bed_porosity = UnsignedFloat(ub=1)
     particle_porosity = UnsignedFloat(ub=1)
     particle_radius = UnsignedFloat()
-    film_diffusion = SizedUnsignedList(size='n_comp')
-    pore_accessibility = SizedUnsignedList(ub=1, size='n_comp', default=1)
+    film_diffusion = SizedUnsignedNdArray(size='n_comp', dtype=float)
+    pore_accessibility = SizedUnsignedNdArray(
+        ub=1, size='n_comp', default=1, dtype=float
+    )
     _parameters = [
         'bed_porosity',
         'particle_porosity',
@@ -793,9 +823,9 @@ class LumpedRateModelWithPores(TubularReactorBase):
         TubularReactorBase._section_dependent_parameters + \
         ['film_diffusion', 'pore_accessibility']
 
-    c = SizedList(size='n_comp', default=0)
-    _cp = SizedUnsignedList(size='n_comp')
-    _q = SizedUnsignedList(size='n_bound_states', default=0)
+    c = SizedNdArray(size='n_comp', default=0, dtype=float)
+    _cp = SizedUnsignedNdArray(size='n_comp', dtype=float)
+    _q = SizedUnsignedNdArray(size='n_bound_states', default=0, dtype=float)
 
     _initial_state = ['cp', 'q']
     _parameters = _parameters + _initial_state
@@ -810,13 +840,13 @@ class LumpedRateModelWithPores(TubularReactorBase):
 
         self.solution_recorder = LRMPRecorder()
 
-    @property
+    @cached_dependent_property('bed_porosity', 'particle_porosity')
     def total_porosity(self):
         """float: Total porosity of the column."""
         return self.bed_porosity + \
             (1 - self.bed_porosity) * self.particle_porosity
 
-    @property
+    @cached_dependent_property('bed_porosity', 'cross_section_area')
     def cross_section_area_interstitial(self):
         """float: Interstitial area between particles.
 
@@ -862,7 +892,7 @@ class LumpedRateModelWithPores(TubularReactorBase):
     def cp(self, cp):
         self._cp = cp
 
-        self.parameters['cp'] = cp
+        self.parameters['cp'] = self._cp
 
     @property
     def q(self):
@@ -874,7 +904,7 @@ class LumpedRateModelWithPores(TubularReactorBase):
             raise CADETProcessError("Cannot set q without binding model.")
         self._q = q
 
-        self.parameters['q'] = q
+        self.parameters['q'] = self._q
 
 
 class GeneralRateModel(TubularReactorBase):
@@ -888,19 +918,19 @@ class GeneralRateModel(TubularReactorBase):
         Porosity of particles.
     particle_radius : UnsignedFloat
         Radius of the particles.
-    film_diffusion : List of unsigned floats. Length depends on n_comp.
+    film_diffusion : Array of unsigned floats. Length depends on n_comp.
         Diffusion rate for components in pore volume.
-    pore_accessibility : List of unsigned floats. Length depends on n_comp.
+    pore_accessibility : Array of unsigned floats. Length depends on n_comp.
         Accessibility of pores for components.
-    pore_diffusion : List of unsigned floats. Length depends on n_comp.
+    pore_diffusion : Array of unsigned floats. Length depends on n_comp.
         Diffusion rate for components in pore volume.
-    surface_diffusion : List of unsigned floats. Length depends on n_comp.
+    surface_diffusion : Array of unsigned floats. Length depends on n_comp.
         Diffusion rate for components in adsrobed state.
-    c : List of unsigned floats. Length depends on n_comp
+    c : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the reactor.
-    cp : List of unsigned floats. Length depends on n_comp
+    cp : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the pores
-    q : List of unsigned floats. Length depends on n_comp
+    q : Array of unsigned floats. Length depends on n_comp
         Initial concntration of the bound phase.
     solution_recorder : GRMRecorder
         Solution recorder for the unit operation.
@@ -914,10 +944,12 @@ class GeneralRateModel(TubularReactorBase):
     bed_porosity = UnsignedFloat(ub=1)
     particle_porosity = UnsignedFloat(ub=1)
     particle_radius = UnsignedFloat()
-    film_diffusion = SizedUnsignedList(size='n_comp')
-    pore_accessibility = SizedUnsignedList(ub=1, size='n_comp', default=1)
-    pore_diffusion = SizedUnsignedList(size='n_comp')
-    _surface_diffusion = SizedUnsignedList(size='n_bound_states')
+    film_diffusion = SizedUnsignedNdArray(size='n_comp', dtype=float)
+    pore_accessibility = SizedUnsignedNdArray(
+        ub=1, size='n_comp', default=1, dtype=float
+    )
+    pore_diffusion = SizedUnsignedNdArray(size='n_comp', dtype=float)
+    _surface_diffusion = SizedUnsignedNdArray(size='n_bound_states', dtype=float)
     _parameters = [
         'bed_porosity', 'particle_porosity', 'particle_radius',
         'film_diffusion', 'pore_accessibility',
@@ -927,9 +959,9 @@ class GeneralRateModel(TubularReactorBase):
         TubularReactorBase._section_dependent_parameters + \
         ['film_diffusion', 'pore_accessibility', 'pore_diffusion', 'surface_diffusion']
 
-    c = SizedList(size='n_comp', default=0)
-    _cp = SizedUnsignedList(size='n_comp')
-    _q = SizedUnsignedList(size='n_bound_states', default=0)
+    c = SizedNdArray(size='n_comp', default=0, dtype=float)
+    _cp = SizedUnsignedNdArray(size='n_comp', dtype=float)
+    _q = SizedUnsignedNdArray(size='n_bound_states', default=0, dtype=float)
     _initial_state = ['cp', 'q']
 
     _parameters = _parameters + _initial_state
@@ -944,14 +976,14 @@ class GeneralRateModel(TubularReactorBase):
 
         self.solution_recorder = GRMRecorder()
 
-    @property
+    @cached_dependent_property('bed_porosity', 'particle_porosity')
     def total_porosity(self):
         """float: Total porosity of the column
         """
         return self.bed_porosity + \
             (1 - self.bed_porosity) * self.particle_porosity
 
-    @property
+    @cached_dependent_property('bed_porosity', 'cross_section_area')
     def cross_section_area_interstitial(self):
         """float: Interstitial area between particles.
 
@@ -997,7 +1029,7 @@ class GeneralRateModel(TubularReactorBase):
     def cp(self, cp):
         self._cp = cp
 
-        self.parameters['cp'] = cp
+        self.parameters['cp'] = self._cp
 
     @property
     def q(self):
@@ -1009,7 +1041,7 @@ class GeneralRateModel(TubularReactorBase):
             raise CADETProcessError("Cannot set q without binding model.")
         self._q = q
 
-        self.parameters['q'] = q
+        self.parameters['q'] = self._q
 
     @property
     def surface_diffusion(self):
@@ -1023,7 +1055,7 @@ class GeneralRateModel(TubularReactorBase):
             )
         self._surface_diffusion = surface_diffusion
 
-        self.parameters['_surface_diffusion'] = surface_diffusion
+        self.parameters['surface_diffusion'] = self._surface_diffusion
 
 
 class Cstr(UnitBaseClass, SourceMixin, SinkMixin):
@@ -1031,9 +1063,9 @@ class Cstr(UnitBaseClass, SourceMixin, SinkMixin):
 
     Parameters
     ----------
-    c : List of unsigned floats. Length depends on n_comp
+    c : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the reactor.
-    q : List of unsigned floats. Length depends on n_comp
+    q : Array of unsigned floats. Length depends on n_comp
         Initial concentration of the bound phase.
     V : unsigned float
         Initial volume of the reactor.
@@ -1063,8 +1095,8 @@ class Cstr(UnitBaseClass, SourceMixin, SinkMixin):
         SourceMixin._section_dependent_parameters + \
         ['flow_rate_filter']
 
-    c = SizedList(size='n_comp', default=0)
-    _q = SizedUnsignedList(size='n_bound_states', default=0)
+    c = SizedNdArray(size='n_comp', default=0, dtype=float)
+    _q = SizedUnsignedNdArray(size='n_bound_states', default=0, dtype=float)
     V = UnsignedFloat()
     _initial_state = ['c', 'q', 'V']
     _parameters = _parameters + _initial_state
@@ -1084,17 +1116,17 @@ class Cstr(UnitBaseClass, SourceMixin, SinkMixin):
         required_parameters.remove('flow_rate')
         return required_parameters
 
-    @property
+    @cached_dependent_property('V')
     def volume(self):
         """float: Alias for volume."""
         return self.V
 
-    @property
+    @cached_dependent_property('porosity', 'V')
     def volume_liquid(self):
         """float: Volume of the liquid phase."""
         return self.porosity * self.V
 
-    @property
+    @cached_dependent_property('porosity', 'V')
     def volume_solid(self):
         """float: Volume of the solid phase."""
         return (1 - self.porosity) * self.V
@@ -1129,4 +1161,4 @@ class Cstr(UnitBaseClass, SourceMixin, SinkMixin):
             raise CADETProcessError("Cannot set q without binding model.")
         self._q = q
 
-        self.parameters['q'] = q
+        self.parameters['q'] = self._q
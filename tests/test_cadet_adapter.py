@@ -11,7 +11,10 @@ def detect_cadet():
     executable = 'cadet-cli'
     if platform.system() == 'Windows':
         executable += '.exe'
-    cli_path = Path(shutil.which(executable))
+    cli_path = shutil.which(executable)
+    if cli_path is None:
+        return False, None, None
+    cli_path = Path(cli_path)
 
     found_cadet = False
     if cli_path.is_file():
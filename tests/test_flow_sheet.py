@@ -154,6 +154,43 @@ class TestFlowSheet(unittest.TestCase):
         with self.assertRaises(CADETProcessError):
             self.batch_flow_sheet.add_unit(duplicate_unit_name)
 
+    def test_unit_index(self):
+        self.assertEqual(self.ssr_flow_sheet.get_unit_index('column'), 3)
+        self.assertEqual(
+            self.ssr_flow_sheet.get_unit_index(self.ssr_flow_sheet.outlet), 4
+        )
+
+        self.ssr_flow_sheet.remove_unit('cstr')
+        self.assertEqual(self.ssr_flow_sheet.get_unit_index('column'), 2)
+        self.assertEqual(
+            self.ssr_flow_sheet.unit_names, ['feed', 'eluent', 'column', 'outlet']
+        )
+
+        cstr = Cstr(self.component_system, name='cstr')
+        with self.assertRaises(CADETProcessError):
+            self.ssr_flow_sheet.get_unit_index(cstr)
+
+    def test_rename_unit(self):
+        flow_sheet = FlowSheet(self.component_system)
+        inlet = Inlet(self.component_system, name='inlet')
+        outlet = Outlet(self.component_system, name='outlet')
+        flow_sheet.add_unit(inlet)
+        flow_sheet.add_unit(outlet)
+
+        inlet.name = 'feed'
+        self.assertIs(flow_sheet['feed'], inlet)
+        self.assertEqual(flow_sheet.unit_names, ['feed', 'outlet'])
+        self.assertEqual(flow_sheet.get_unit_index('feed'), 0)
+
+        flow_sheet.add_connection('feed', 'outlet')
+        self.assertIn(outlet, flow_sheet.connections[inlet].destinations)
+
+        with self.assertRaises(CADETProcessError):
+            flow_sheet.add_unit(Inlet(self.component_system, name='feed'))
+
+        flow_sheet.units_dict.pop('feed')
+        self.assertIs(flow_sheet['feed'], inlet)
+
     def test_inlets(self):
         self.assertIn(self.ssr_flow_sheet.feed, self.ssr_flow_sheet.inlets)
         self.assertIn(self.ssr_flow_sheet.eluent, self.ssr_flow_sheet.inlets)
@@ -526,6 +563,11 @@ class TestFlowSheet(unittest.TestCase):
         output_state = self.ssr_flow_sheet.output_states[column]
         np.testing.assert_equal(output_state, output_state_expected)
 
+        self.ssr_flow_sheet.set_output_state(column, np.array([0.3, 0.7]))
+        output_state_expected = [0.3, 0.7]
+        output_state = self.ssr_flow_sheet.output_states[column]
+        np.testing.assert_equal(output_state, output_state_expected)
+
         self.ssr_flow_sheet.set_output_state(
             column,
             {
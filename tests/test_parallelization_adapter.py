@@ -108,6 +108,18 @@ class TestParallelEvaluation(unittest.TestCase):
             results = backend.evaluate(evaluation_function, [0.01] * 4)
             self.assertTrue(all(results))
 
+    def test_result_order(self):
+        def evaluation_function(x):
+            return x**2
+
+        population = list(range(7))
+        for Backend in backends:
+            backend = Backend()
+            if not isinstance(backend, SequentialBackend):
+                backend.n_cores = min(n_cores, cpu_count)
+            results = backend.evaluate(evaluation_function, population)
+            self.assertEqual(results, [x**2 for x in population])
+
     @unittest.skipIf(found_cadet is False, "Skip if CADET is not installed.")
     def test_parallel_cadet_initialization(self):
         def evaluation_function(x):
@@ -5,7 +5,7 @@ import numpy as np
 from CADETProcess.dataStructure import (
     Structure,
     Constant, Switch,
-    Typed, Integer, String, List,
+    Typed, Integer, Float, String, List,
     Callable,
     RangedFloat, UnsignedInteger,
     SizedList, SizedNdArray,
@@ -88,6 +88,23 @@ class TestParameterDictionaries(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.model.parameters = {'not_a_valid_param': 1}
 
+    def test_parameters_dict_setter_prepared(self):
+        class Model(Structure):
+            param = Float()
+
+            _parameters = ['param']
+
+        model = Model()
+        model.parameters = {'param': 1}
+        self.assertIsInstance(model._parameters_dict['param'], float)
+
+    def test_parameters_dict_cached(self):
+        parameters = self.model.parameters
+        self.assertIs(parameters, self.model.parameters)
+
+        self.model.param = 3
+        self.assertEqual(parameters['param'], 3)
+
 
 class TestConstant(unittest.TestCase):
 
@@ -9,6 +9,7 @@ import unittest
 import numpy as np
 
 from CADETProcess.processModel import ComponentSystem
+from CADETProcess.processModel import Langmuir, NoBinding
 from CADETProcess.processModel import (
     Inlet, Cstr,
     TubularReactor, LumpedRateModelWithPores, LumpedRateModelWithoutPores
@@ -117,6 +118,31 @@ class Test_Unit_Operation(unittest.TestCase):
         lrmwop.cross_section_area = cross_section_area/2
         self.assertAlmostEqual(lrmwop.diameter, diameter/(2**0.5))
 
+    def test_cached_geometry(self):
+        lrmwp = self.create_lrmwp()
+        self.assertAlmostEqual(lrmwp.volume_liquid, total_porosity * volume)
+
+        lrmwp.diameter = 2 * diameter
+        self.assertAlmostEqual(lrmwp.cross_section_area, 4 * cross_section_area)
+        self.assertAlmostEqual(lrmwp.volume_liquid, 4 * total_porosity * volume)
+
+        lrmwp.bed_porosity = 0.5
+        total_porosity_new = 0.5 + 0.5 * particle_porosity
+        self.assertAlmostEqual(lrmwp.total_porosity, total_porosity_new)
+        self.assertAlmostEqual(
+            lrmwp.volume_liquid, 4 * total_porosity_new * volume
+        )
+        self.assertAlmostEqual(lrmwp.volume_interstitial, 4 * 0.5 * volume)
+
+        lrmwp.cross_section_area = cross_section_area
+        self.assertAlmostEqual(lrmwp.diameter, diameter)
+        self.assertAlmostEqual(lrmwp.volume, volume)
+
+        cstr = self.create_cstr()
+        self.assertAlmostEqual(cstr.volume_liquid, total_porosity * volume)
+        cstr.V = 2 * volume
+        self.assertAlmostEqual(cstr.volume_liquid, 2 * total_porosity * volume)
+
     def test_convection_dispersion(self):
         tube = self.create_tubular_reactor()
         lrmwp = self.create_lrmwp()
@@ -181,6 +207,26 @@ class Test_Unit_Operation(unittest.TestCase):
         cstr.flow_rate = ref
         np.testing.assert_equal(cstr.flow_rate, ref)
 
+    def test_component_arrays(self):
+        lrmwp = self.create_lrmwp()
+
+        np.testing.assert_equal(lrmwp.pore_accessibility, [1, 1])
+
+        lrmwp.film_diffusion = [1, 2]
+        self.assertIsInstance(lrmwp.film_diffusion, np.ndarray)
+        self.assertEqual(lrmwp.film_diffusion.dtype, np.float64)
+
+        film_diffusion = lrmwp.film_diffusion.copy()
+        film_diffusion[0] = 0.5
+        lrmwp.film_diffusion = film_diffusion
+        np.testing.assert_equal(lrmwp.parameters['film_diffusion'], [0.5, 2])
+
+        with self.assertRaises(ValueError):
+            lrmwp.film_diffusion = [-1, 2]
+
+        with self.assertRaises(ValueError):
+            lrmwp.film_diffusion = [1, 2, 3]
+
     def test_parameters(self):
         """
         Notes
@@ -216,6 +262,31 @@ class Test_Unit_Operation(unittest.TestCase):
 
         self.assertEqual(cstr.required_parameters, ['V'])
 
+    def test_sub_model_parameters(self):
+        lrmwp = self.create_lrmwp()
+        self.assertIn('discretization', lrmwp.parameters)
+        self.assertNotIn('binding_model', lrmwp.parameters)
+
+        binding_model = Langmuir(self.component_system)
+        lrmwp.binding_model = binding_model
+        self.assertIs(
+            lrmwp.parameters['binding_model'], binding_model.parameters
+        )
+
+        lrmwp.binding_model = NoBinding()
+        self.assertNotIn('binding_model', lrmwp.parameters)
+
+    def test_set_initial_state_parameters(self):
+        lrmwp = self.create_lrmwp()
+        lrmwp.binding_model = Langmuir(self.component_system)
+
+        lrmwp.parameters = {'q': [1, 2], 'cp': [1, 2]}
+        for param in ['q', 'cp']:
+            value = lrmwp.parameters[param]
+            self.assertIsInstance(value, np.ndarray)
+            self.assertEqual(value.dtype, np.float64)
+            np.testing.assert_equal(value, getattr(lrmwp, param))
+
 
 if __name__ == '__main__':
     unittest.main()